@@ -14,7 +14,6 @@ B.D. Cullity, Elements of X-Ray Diffraction (Second Edition), 11-20, (1978).
 import copy
 import enum
 import functools
-import itertools
 import pathlib
 import typing
 from typing import Tuple
@@ -22,7 +21,6 @@ from typing import Tuple
 import numpy as np
 import periodictable
 import scipy.constants
-from scipy.interpolate import interp1d
 
 CXRO_PATH = pathlib.Path(__file__).parent / 'CXRO'
 
@@ -39,18 +37,41 @@ class ConfigMode(enum.Enum):
     Ceiling = enum.auto()
 
 
+class AbsorptionTable(typing.NamedTuple):
+    """
+    Photoabsorption data for a single material.
+
+    Each quantity is stored as its own contiguous array, matched by index.
+    """
+    #: Photon energy. [eV]
+    eV: np.ndarray
+    #: Atomic scattering factor f_2.
+    f2: np.ndarray
+    #: Absorption constant mu. [1/m]
+    mu: np.ndarray
+
+
 @functools.lru_cache(maxsize=32, typed=False)
 def in_out_combinations(num_blades: int):
     """
     All possible in/out state configurations of ``N`` attenuator blades.
 
+    Row ``k`` holds the bits of ``k``, with bit ``i`` being the state of blade
+    ``i``.  Blade 0 is therefore the fastest-changing column.
+
     Returns
     -------
     np.ndarray
-        Of size 2 ** num_blades, with all possible combinations of inserted (1)
-        and removed/stuck (nan).
+        Of size (2 ** num_blades, num_blades) and dtype uint8, with all
+        possible combinations of inserted (1) and removed/stuck (0).
     """
-    return np.asarray(list(itertools.product([np.nan, 1], repeat=num_blades)))
+    configs = np.arange(1 << num_blades, dtype=np.uint64)
+    shifts = np.arange(num_blades, dtype=np.uint64)
+    table = (configs[:, np.newaxis] >> shifts) & np.uint64(1)
+    table = table.astype(np.uint8)
+    # The cached table is shared by all callers:
+    table.flags.writeable = False
+    return table
 
 
 class Config:
@@ -76,6 +97,214 @@ class Config:
         ))
 
 
+def _reachable_log_transmissions(
+        log_transmissions: np.ndarray,
+        ) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Build the sorted set of reachable log-transmissions, blade by blade.
+
+    Stuck filters (with a log-transmission of `NaN`) are excluded from the
+    combinations entirely.  Configurations which yield identical
+    log-transmissions are pruned as they are found, keeping the one with the
+    fewest inserted filters (and of those, the first found).
+
+    Parameters
+    ----------
+    log_transmissions : np.ndarray
+        Natural log of the transmission of each filter.
+
+    Returns
+    -------
+    reachable : np.ndarray
+        Sorted, unique log-transmission values.
+
+    masks : np.ndarray
+        Bitmasks of inserted filters (bit ``i`` for filter ``i``), matched
+        with ``reachable``.
+    """
+    reachable = np.zeros(1)
+    masks = np.zeros(1, dtype=np.uint64)
+    for idx, log_t in enumerate(log_transmissions):
+        if np.isnan(log_t):
+            continue
+
+        # Every configuration reachable so far either leaves this filter out
+        # or inserts it:
+        new = np.concatenate([reachable, reachable + log_t])
+        new_masks = np.concatenate([masks, masks | np.uint64(1 << idx)])
+
+        # Sort by value, then by the number of inserted filters, such that
+        # the first of any identical values has the fewest filters.
+        sort_indices = np.lexsort((_popcount(new_masks), new))
+        reachable = new[sort_indices]
+        masks = new_masks[sort_indices]
+
+        unique = np.ones(len(reachable), dtype=bool)
+        unique[1:] = reachable[1:] != reachable[:-1]
+        reachable = reachable[unique]
+        masks = masks[unique]
+
+    return reachable, masks
+
+
+def _popcount(masks: np.ndarray) -> np.ndarray:
+    """The number of inserted filters in each of the given bitmasks."""
+    as_bytes = np.ascontiguousarray(masks, dtype='<u8').view(np.uint8)
+    return np.unpackbits(as_bytes.reshape(-1, 8), axis=1).sum(axis=1)
+
+
+def _fewest_filters(candidates: np.ndarray,
+                    first_masks: np.ndarray,
+                    second_masks: np.ndarray) -> int:
+    """
+    Of the equally good candidate pairings, pick the one with the fewest
+    inserted filters.
+
+    Parameters
+    ----------
+    candidates : np.ndarray
+        Pairs of (first half index, second half index), of shape (N, 2).
+
+    first_masks, second_masks : np.ndarray
+        Bitmasks of each half, as from `_split_reachable`.
+
+    Returns
+    -------
+    int
+        The row of ``candidates`` to use.
+    """
+    if len(candidates) == 1:
+        return 0
+    counts = (_popcount(first_masks[candidates[:, 0]]) +
+              _popcount(second_masks[candidates[:, 1]]))
+    return int(np.argmin(counts))
+
+
+def _mask_to_filter_states(mask: np.uint64, num_filters: int) -> np.ndarray:
+    """Decode a bitmask of inserted filters into an array of 0/1 states."""
+    as_bytes = np.asarray([mask], dtype='<u8').view(np.uint8)
+    return np.unpackbits(as_bytes, bitorder='little')[:num_filters]
+
+
+@functools.lru_cache(maxsize=16)
+def _split_reachable(
+        log_transmissions: bytes,
+        ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Reachable log-transmissions for two halves of the given filters.
+
+    Rather than enumerating all 2 ** N configurations, the usable filters are
+    split into two halves of at most 2 ** (N / 2) configurations each.  Every
+    configuration is the pairing of one from each half.
+
+    The result depends only on the filter transmissions, and not the desired
+    transmission, so it is cached.  ``log_transmissions`` is given as the raw
+    bytes of a float64 array to be hashable.
+
+    Returns
+    -------
+    first, first_masks, second, second_masks : np.ndarray
+        As in `_reachable_log_transmissions`, for each half.
+    """
+    log_transmissions = np.frombuffer(log_transmissions, dtype=np.float64)
+    usable = np.flatnonzero(~np.isnan(log_transmissions))
+    in_first_half = np.zeros(len(log_transmissions), dtype=bool)
+    in_first_half[usable[:len(usable) // 2]] = True
+
+    first, first_masks = _reachable_log_transmissions(
+        np.where(in_first_half, log_transmissions, np.nan)
+    )
+    second, second_masks = _reachable_log_transmissions(
+        np.where(in_first_half, np.nan, log_transmissions)
+    )
+    result = (first, first_masks, second, second_masks)
+    # The cached arrays are shared by all callers:
+    for arr in result:
+        arr.flags.writeable = False
+    return result
+
+
+def _find_configs_log(
+        log_transmissions: np.ndarray,
+        log_t_des: float,
+        ) -> typing.List[Tuple[np.uint64, float]]:
+    """
+    Find the floor and ceiling configurations, entirely in log-space.
+
+    Parameters
+    ----------
+    log_transmissions : np.ndarray
+        Natural log of the transmission of each filter.  Stuck filters should
+        be `NaN`.
+
+    log_t_des : float
+        Natural log of the desired transmission value.
+
+    Returns
+    -------
+    list of (mask, log_transmission)
+        For each of the floor and ceiling configurations, the bitmask of
+        inserted filters and its log-transmission.
+    """
+    if len(log_transmissions) > 64:
+        raise ValueError('At most 64 filters are supported')
+
+    if np.isnan(log_t_des):
+        # A desired transmission that is NaN or negative is only satisfied by
+        # the most attenuating configuration.
+        log_t_des = -np.inf
+
+    first, first_masks, second, second_masks = _split_reachable(
+        np.ascontiguousarray(log_transmissions, dtype=np.float64).tobytes()
+    )
+
+    # For each configuration of the first half, bisect the second half to
+    # find its best partner just below (or equal to) and just above (or equal
+    # to) the desired value.
+    with np.errstate(invalid='ignore'):
+        remaining = log_t_des - first
+    idx_low = np.searchsorted(second, remaining, side='right') - 1
+    idx_high = np.searchsorted(second, remaining, side='left')
+
+    # A fully-attenuating configuration exactly meets a desired transmission
+    # of zero, regardless of its partner:
+    exactly_zero = np.isnan(remaining)
+    idx_low[exactly_zero] = 0
+    idx_high[exactly_zero] = 0
+
+    # In some cases, there may not be a floor or ceiling configuration that
+    # fits - give back the closest in that case.  Where several pairings
+    # reach the same value, prefer the one with the fewest filters.
+    has_low = idx_low >= 0
+    if has_low.any():
+        totals = np.where(has_low, first + second[idx_low], -np.inf)
+        best = np.flatnonzero(has_low & (totals == totals.max()))
+        candidates = np.column_stack((best, idx_low[best]))
+        low = candidates[
+            _fewest_filters(candidates, first_masks, second_masks)
+        ]
+    else:
+        low = (0, 0)
+
+    has_high = idx_high < len(second)
+    if has_high.any():
+        idx_high = np.minimum(idx_high, len(second) - 1)
+        totals = np.where(has_high, first + second[idx_high], np.inf)
+        best = np.flatnonzero(has_high & (totals == totals.min()))
+        candidates = np.column_stack((best, idx_high[best]))
+        high = candidates[
+            _fewest_filters(candidates, first_masks, second_masks)
+        ]
+    else:
+        high = (len(first) - 1, len(second) - 1)
+
+    return [
+        (first_masks[first_idx] | second_masks[second_idx],
+         first[first_idx] + second[second_idx])
+        for first_idx, second_idx in (low, high)
+    ]
+
+
 def find_configs(
         all_transmissions: typing.List[float],
         t_des: float,
@@ -89,64 +318,28 @@ def find_configs(
 
     Parameters
     ----------
-    all_transmissions : list of (float or nan)
+    all_transmissions : list or np.ndarray of (float or nan)
         Basis vector of all filter transmission values.
         Note: Stuck filters should have transmission of `NaN`.
 
     t_des : float
         Desired transmission value.
     """
+    t_vec = np.ascontiguousarray(all_transmissions, dtype=np.float64)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        # Transmissions multiply, so work with sums in log-space instead:
+        log_transmissions = np.log(t_vec)
+        log_t_des = np.log(t_des)
 
-    config_table = in_out_combinations(len(all_transmissions))
-
-    # Table of transmissions for all configurations is obtained by multiplying
-    # basis by configurations in/out state matrix.
-    t_table = np.nanprod(all_transmissions * config_table,
-                         axis=1)
-
-    # Create a table of configurations and their associated beam transmission
-    # values, sorted by transmission value.
-    configs = np.asarray([t_table, np.arange(len(config_table))])
-
-    # Sort based on transmission value, retaining index order:
-    sort_indices = configs[0, :].argsort()
-    t_config_table = configs.T[sort_indices]
-
-    # Find the index of the filter configuration which minimizes the
-    # differences between the desired and closest achievable transmissions.
-    idx_closest = np.argmin(np.abs(t_config_table[:, 0] - t_des))
-
-    def get_config_and_transmission(idx: int) -> Tuple[np.ndarray, float]:
-        conf = config_table[int(t_config_table[idx, 1])]
-        transmission = np.nanprod(all_transmissions * conf)
-        return conf, transmission
-
-    # Obtain the optimal filter configuration and its transmission.
-    closest, t_closest = get_config_and_transmission(idx_closest)
-
-    # Determine the optimal configurations for "best highest" and "best lowest"
-    # achievable transmissions.
-    if t_closest < t_des:
-        idx_low = idx_closest
-        idx_high = min((idx_closest + 1, len(t_config_table) - 1))
-    elif t_closest > t_des:
-        idx_low = max((idx_closest - 1, 0))
-        idx_high = idx_closest
-    else:
-        # The optimal configuration achieves the desired transmission exactly.
-        idx_low = idx_closest
-        idx_high = idx_closest
-
-    config_low, t_best_low = get_config_and_transmission(idx_low)
-    config_high, t_best_high = get_config_and_transmission(idx_high)
-
+    all_transmissions = t_vec.tolist()
     return [
-        Config(all_transmissions=list(all_transmissions),
-               filter_states=np.nan_to_num(config_low).astype(np.int),
-               transmission=t_best_low),
-        Config(all_transmissions=list(all_transmissions),
-               filter_states=np.nan_to_num(config_high).astype(np.int),
-               transmission=t_best_high)
+        Config(
+            all_transmissions=all_transmissions,
+            filter_states=_mask_to_filter_states(mask, len(t_vec)),
+            transmission=np.exp(log_transmission),
+        )
+        for mask, log_transmission in _find_configs_log(log_transmissions,
+                                                        log_t_des)
     ]
 
 
@@ -230,41 +423,50 @@ def get_best_config_with_material_priority(
             'transmissions and materials must be of the same length'
         )
 
+    if isinstance(mode, str):
+        mode = ConfigMode[mode]
+
     # This configuration is assembled based on the material priorities:
     final_config = Config(
         all_transmissions=transmissions,
         transmission=1.0,
-        filter_states=np.zeros(len(transmissions), dtype=np.int),
+        filter_states=np.zeros(len(transmissions), dtype=np.uint8),
     )
 
-    for mat_idx, material in enumerate(material_order):
-        # Assemble {idx: transmission} for only the given material
-        idx_to_transmission = {
-            idx: transm
-            for idx, (mat, transm) in enumerate(zip(materials, transmissions))
-            if mat == material
-        }
-
-        # Find the configurations just for this material, picking the ceiling:
-        partial_config = get_best_config(
-            list(idx_to_transmission.values()),
-            t_des=t_des / final_config.transmission,
-            mode=mode,
+    # Stay in log-space throughout: the transmission left for each material
+    # is then a difference rather than a ratio.
+    t_vec = np.ascontiguousarray(transmissions, dtype=np.float64)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        log_transmissions = np.log(t_vec)
+        log_t_des = np.log(t_des)
+
+    log_t_final = 0.0
+    all_materials = np.asarray(materials)
+    for material in material_order:
+        # Find the configurations just for this material:
+        indices = np.flatnonzero(all_materials == material)
+        with np.errstate(invalid='ignore'):
+            log_t_remaining = log_t_des - log_t_final
+        floor, ceiling = _find_configs_log(
+            log_transmissions[indices], log_t_des=log_t_remaining,
+        )
+        mask, log_transmission = (
+            floor if mode == ConfigMode.Floor else ceiling
         )
 
         # Update the final, aggregated configuration - transmission:
-        final_config.transmission *= partial_config.transmission
+        log_t_final += log_transmission
 
         # And individual filter states:
-        for idx, inserted in zip(idx_to_transmission,
-                                 partial_config.filter_states):
-            final_config.filter_states[idx] = inserted
+        filter_states = _mask_to_filter_states(mask, len(indices))
+        final_config.filter_states[indices] = filter_states
 
-        if not all(partial_config.filter_states):
+        if not all(filter_states):
             # Doubly-ensure that all filters are inserted before going to
             # the next material.
             break
 
+    final_config.transmission = np.exp(log_t_final)
     return final_config
 
 
@@ -297,55 +499,57 @@ def get_ladder_configs(
         Best configuration as close to t_des as possible but not under.
     """
 
-    # Build (idx, transmission) for each blade
-    index_and_transmission = [
-        ([(np.nan, 1.0)] + list(enumerate(transmission)))
+    # Per-blade options: index 0 is "no filter inserted", followed by each
+    # filter's transmission
+    blade_options = [
+        np.concatenate(([1.0], np.asarray(transmission, dtype=np.float64)))
         for transmission in blade_transmissions
     ]
-
-    # Take the product to give all possibilities
-    options = np.asarray(
-        list(itertools.product(*index_and_transmission))
-    )
-    # options[configuration of blades,
-    #         blade index,
-    #         0=filter index/1=transmission]
-
-    # Multiply out the transmission per configuration, resulting in a single
-    # array of transmission values
-    config_transmission = np.product(options[:, :, 1], axis=1)
+    shape = tuple(len(options) for options in blade_options)
+
+    # Multiply out the transmission per configuration - as a sum in
+    # log-space, broadcasting each blade along its own axis - resulting in a
+    # single array of log-transmission values.  Configurations are ordered as
+    # in itertools.product, with the last blade varying the fastest.
+    config_log_transmission = np.zeros(shape)
+    with np.errstate(divide='ignore'):
+        for blade, options in enumerate(blade_options):
+            axis_shape = [1] * len(shape)
+            axis_shape[blade] = -1
+            config_log_transmission += np.log(options).reshape(axis_shape)
+        log_t_des = np.log(t_des) if t_des > 0.0 else -np.inf
+    config_log_transmission = config_log_transmission.ravel()
 
     def to_config(idx):
-        states = np.nan_to_num(options[idx, :, 0], nan=-1)
+        option_indices = np.unravel_index(idx, shape)
+        transmissions = [
+            options[option_idx]
+            for options, option_idx in zip(blade_options, option_indices)
+        ]
         return Config(
-            all_transmissions=list(options[idx, :, 1]),
-            filter_states=[state if state >= 0 else None
-                           for state in states.astype(int).tolist()],
-            transmission=config_transmission[idx],
+            all_transmissions=transmissions,
+            filter_states=[int(option_idx) - 1 if option_idx > 0 else None
+                           for option_idx in option_indices],
+            transmission=np.prod(transmissions),
         )
 
-    # Find the indices of filter configuration which minimize the differences
-    # between the desired and closest achievable transmissions.
-    closest_indices = np.argsort(np.abs(config_transmission - t_des))
-
-    # Determine the closest transmissions that meet the floor/ceiling
-    # criteria.
-    closest_transmissions = config_transmission[closest_indices]
-    closest_low, = np.where(closest_transmissions <= t_des)
-    closest_high, = np.where(closest_transmissions >= t_des)
+    # Sort by transmission, then bisect to find the configurations just below
+    # (or equal to) and just above (or equal to) the desired transmission.
+    sort_indices = np.argsort(config_log_transmission, kind='stable')
+    sorted_log_transmission = config_log_transmission[sort_indices]
+    idx_low = np.searchsorted(sorted_log_transmission, log_t_des,
+                              side='right') - 1
+    idx_high = np.searchsorted(sorted_log_transmission, log_t_des,
+                               side='left')
 
     # But in some cases, there may not be a floor or ceiling configuration
-    # that fits.
-    if not len(closest_low) and len(closest_high):
-        # There's nothing lower - give back the closest
-        closest_low = closest_high
-    if not len(closest_high) and len(closest_low):
-        # There's nothing higher - give the closest
-        closest_high = closest_low
+    # that fits - give back the closest in that case.
+    idx_low = max((idx_low, 0))
+    idx_high = min((idx_high, len(sort_indices) - 1))
 
     return [
-        to_config(closest_indices[closest_low[0]]),
-        to_config(closest_indices[closest_high[0]]),
+        to_config(sort_indices[idx_low]),
+        to_config(sort_indices[idx_high]),
     ]
 
 
@@ -389,7 +593,7 @@ def get_ladder_config(
 
 
 def find_closest_energy(photon_energy: float,
-                        table: np.ndarray) -> typing.Tuple[float, int]:
+                        table: AbsorptionTable) -> typing.Tuple[float, int]:
     """
     Find the closest tabulated photon energy in the given table.
 
@@ -398,7 +602,7 @@ def find_closest_energy(photon_energy: float,
     photon_energy : float
         The photon energy to find. [eV]
 
-    table : np.ndarray
+    table : AbsorptionTable
         The absorption table.
 
     Returns
@@ -407,19 +611,22 @@ def find_closest_energy(photon_energy: float,
         The closest energy. [eV]
 
     closest_index : int
-        The array index of the closest energy.
+        The array index of the closest energy.  Energies outside of the table
+        use the closest end of the table.
     """
-    min_energy = table[0, 0]
-    max_energy = table[-1, 0]
-    energy_increment = (max_energy - min_energy) / table.shape[0]
-    closest_idx = int(np.rint((photon_energy - min_energy) / energy_increment))
-    if closest_idx < 0:
-        closest_idx = 0
-    if closest_idx >= table.shape[0]:
-        closest_idx = -1  # Use greatest tabulated value.
-
-    closest_eV = table[closest_idx, 0]
-    return closest_eV, closest_idx
+    # Bisect the tabulated energies, then pick the closer of the two
+    # neighbors.  This does not assume a uniformly-spaced table.  Plain
+    # Python scalars are used throughout, as this is called for every filter
+    # on every photon energy update.
+    photon_energy = float(photon_energy)
+    energies = table.eV
+    closest_idx = int(energies.searchsorted(photon_energy))
+    closest_idx = min(max(closest_idx, 1), len(energies) - 1)
+    below = float(energies[closest_idx - 1])
+    above = float(energies[closest_idx])
+    if photon_energy - below < above - photon_energy:
+        return below, closest_idx - 1
+    return above, closest_idx
 
 
 @functools.lru_cache()
@@ -456,10 +663,17 @@ def _ev_linear(ev_low, ev_high, res=10, dec=2):
        Decimal places.
     """
     num = int(ev_high - ev_low) * res + 1
+    start = ev_low * res
+    if (float(start).is_integer() and start + num - 1 == ev_high * res and
+            (10 ** dec) % res == 0):
+        # Both ends lie on the grid, and every step is representable with
+        # ``dec`` decimal places: integer steps divided by ``res`` are
+        # already correctly rounded, without a pass through np.around.
+        return np.arange(start, start + num) / res
     return np.around(np.linspace(ev_low, ev_high, num), dec)
 
 
-def _fill_data_linear(element, ev_low, ev_high, res=10):
+def _fill_data_linear(element, new_range):
     """
     Interpolates data to add more samples.
 
@@ -468,28 +682,36 @@ def _fill_data_linear(element, ev_low, ev_high, res=10):
     element : str
        Formula of the element to open e.g. "Si", "si", "C", "Au"
 
-    ev_low : float
-       Lower bound of photon energy range. [eV]
-
-    ev_high : float
-       Upper bound of photon energy range. [eV]
-
-    res : float
-       Magnitude of resolution.  Default of 10 yields 0.1 eV resolution.
+    new_range : np.ndarray
+       Increasing photon energies to interpolate at, as from `_ev_linear`.
+       [eV]
     """
     raw_data = nff_to_npy(element)
-    new_range = _ev_linear(ev_low, ev_high, res=10)
-    return interp1d(raw_data[:, 0], raw_data[:, 2])(new_range)
+    # The tabulated energies are not strictly increasing everywhere (e.g.,
+    # the silicon K-edge), but np.interp requires that they are:
+    sort_indices = np.argsort(raw_data[:, 0], kind='stable')
+    energies = raw_data[sort_indices, 0]
+    f2 = raw_data[sort_indices, 2]
+    if new_range[0] < energies[0] or new_range[-1] > energies[-1]:
+        raise ValueError(
+            f'Photon energy range {new_range[0]} to {new_range[-1]} eV is '
+            f'outside of the tabulated data for {element}'
+        )
+    return np.interp(new_range, energies, f2)
 
 
+@functools.lru_cache(maxsize=16)
 def get_absorption_table(formula: str,
                          ev_low: float = 10.,
                          ev_high: float = 30000., *,
                          atomic_weight: float = None,
-                         density: float = None) -> np.ndarray:
+                         density: float = None) -> AbsorptionTable:
     """
     Data table for photoabsorption calculations.
 
+    Tables are cached, as they are deterministic for a given set of
+    arguments.  The returned arrays are read-only.
+
     Parameters
     ----------
     formula : str
@@ -524,24 +746,29 @@ def get_absorption_table(formula: str,
             density = periodictable.formula(formula).density * 1e6
             # units: g/cm^3 -> m^3
 
-    fs = _fill_data_linear(formula, ev_low, ev_high)
-    table = np.zeros([fs.shape[0], 3])
     eV_space = _ev_linear(ev_low, ev_high)
+    fs = _fill_data_linear(formula, eV_space)
 
     NA = scipy.constants.Avogadro
     c = scipy.constants.speed_of_light
     h, *_ = scipy.constants.physical_constants['Planck constant in eV/Hz']
     r0, *_ = scipy.constants.physical_constants['classical electron radius']
 
-    table[:, 0] = eV_space[:]
-    table[:, 1] = fs  # scattering factor f_2
-    table[:, 2] = ((2 * r0 * h * c * fs/eV_space) * density *
-                   (NA / atomic_weight))  # absorption constant \mu
+    # Absorption constant \mu = coeff * f_2 / E, with the scalar constants
+    # folded together first and the rest done in-place:
+    coeff = 2 * r0 * h * c * density * NA / atomic_weight
+    mu = np.divide(fs, eV_space)
+    mu *= coeff
+
+    table = AbsorptionTable(eV=eV_space, f2=fs, mu=mu)
+    # The cached table is shared by all callers:
+    for arr in table:
+        arr.flags.writeable = False
     return table
 
 
 def get_transmission(photon_energy: float,
-                     table: np.ndarray,
+                     table: AbsorptionTable,
                      thickness: float,
                      ) -> float:
     """
@@ -555,7 +782,7 @@ def get_transmission(photon_energy: float,
     photon_energy : float
         The photon energy to find. [eV]
 
-    table : np.ndarray
+    table : AbsorptionTable
         The absorption table.
 
     thickness : float
@@ -567,4 +794,4 @@ def get_transmission(photon_energy: float,
         Normalized transmission value.
     """
     _, idx = find_closest_energy(photon_energy, table)
-    return np.exp(-table[idx, 2] * thickness)
+    return np.exp(-table.mu[idx] * thickness)
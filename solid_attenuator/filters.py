@@ -1,5 +1,7 @@
+import asyncio
 from typing import Dict, Optional
 
+import numpy as np
 from caproto import ChannelType
 from caproto.server import PVGroup, SubGroup, pvproperty
 from caproto.server.autosave import autosaved
@@ -157,11 +159,18 @@ class FilterGroup(PVGroup):
         closest_energy, i = calculator.find_closest_energy(
             energy_ev, self.table)
 
-        await self.closest_index.write(i)
-        await self.closest_energy.write(closest_energy)
-        await self.transmission.write(self.get_transmission(energy_ev))
-        await self.transmission_3omega.write(
-            self.get_transmission(3.*energy_ev))
+        # Reuse the lookup above; only the third harmonic needs its own:
+        transmission = np.exp(
+            -self.table.mu[i] * (self.thickness.value * 1e-6)  # um -> meters
+        )
+
+        await asyncio.gather(
+            self.closest_index.write(i),
+            self.closest_energy.write(closest_energy),
+            self.transmission.write(transmission),
+            self.transmission_3omega.write(
+                self.get_transmission(3.*energy_ev)),
+        )
 
     def get_transmission(self, photon_energy_ev: float):
         """
@@ -178,10 +187,11 @@ class FilterGroup(PVGroup):
         transmission : float
             Normalized transmission value.
         """
+        # Positional arguments skip keyword matching on this per-update path:
         return calculator.get_transmission(
-            photon_energy=photon_energy_ev,
-            table=self.table,
-            thickness=self.thickness.value * 1e-6,  # um -> meters
+            photon_energy_ev,
+            self.table,
+            self.thickness.value * 1e-6,  # um -> meters
         )
 
     @material.putter
@@ -201,7 +211,10 @@ class FilterGroup(PVGroup):
         """
         energy = self._last_photon_energy
         await self.thickness.write(value, verify_value=False)
-        await self.transmission.write(self.get_transmission(energy))
+        await asyncio.gather(
+            self.transmission.write(self.get_transmission(energy)),
+            self.transmission_3omega.write(self.get_transmission(3.*energy)),
+        )
 
 
 class InOutFilterGroup(FilterGroup):
@@ -334,13 +347,15 @@ class EightFilterGroup(FilterGroup):
             thickness = flt.thickness.value
             material = flt.material.value
 
-        await self.transmission.write(transmission, verify_value=False)
-        await self.transmission_3omega.write(transmission_3omega,
-                                             verify_value=False)
-        await self.closest_index.write(closest_index, verify_value=False)
-        await self.closest_energy.write(closest_energy, verify_value=False)
-        await self.thickness.write(thickness, verify_value=False)
-        await self.material.write(material, verify_value=False)
+        await asyncio.gather(
+            self.transmission.write(transmission, verify_value=False),
+            self.transmission_3omega.write(transmission_3omega,
+                                           verify_value=False),
+            self.closest_index.write(closest_index, verify_value=False),
+            self.closest_energy.write(closest_energy, verify_value=False),
+            self.thickness.write(thickness, verify_value=False),
+            self.material.write(material, verify_value=False),
+        )
 
     async def set_photon_energy(self, energy_ev: float):
         """
@@ -352,8 +367,10 @@ class EightFilterGroup(FilterGroup):
             The photon energy [eV].
         """
         self._last_photon_energy = energy_ev
-        for flt in self.filters.values():
-            await flt.set_photon_energy(energy_ev)
+        await asyncio.gather(
+            *(flt.set_photon_energy(energy_ev)
+              for flt in self.filters.values())
+        )
         await self._update()
 
     @property
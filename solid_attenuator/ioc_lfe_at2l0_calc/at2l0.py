@@ -1,6 +1,7 @@
 """
 This is the IOC source code for the unique AT2L0, with its 18 in-out filters.
 """
+import asyncio
 from typing import List
 
 from caproto.server import SubGroup, expand_macros
@@ -56,8 +57,9 @@ class SystemGroup(SystemGroupBase):
 
         materials = list(flt.material.value for flt in filters)
         transmissions = list(flt.transmission.value for flt in filters)
-        for filter in stuck + filters:
-            await filter.set_photon_energy(energy)
+        await asyncio.gather(
+            *(filter.set_photon_energy(energy) for filter in stuck + filters)
+        )
 
         # Account for stuck filters when calculating desired transmission:
         stuck_transmission = self.calculate_stuck_transmission()
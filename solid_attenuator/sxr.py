@@ -10,6 +10,8 @@ This is intended to be used for the following attenuators:
 | AT2K2-SOLID | NEH 2.2    | H2.2 | 788.8 |
 | AT1K3-SOLID | TXI        | H1.1 | ~763  |
 """
+import asyncio
+
 from caproto.server import SubGroup, expand_macros
 from caproto.server.autosave import RotatingFileManager
 
@@ -37,8 +39,9 @@ class SystemGroup(SystemGroupBase):
         stuck = self.get_filters(stuck=True, inactive=False, normal=False)
         blades = self.get_filters(stuck=False, inactive=False, normal=True)
 
-        for filter in stuck + blades:
-            await filter.set_photon_energy(energy)
+        await asyncio.gather(
+            *(filter.set_photon_energy(energy) for filter in stuck + blades)
+        )
 
         # Using the above-calculated transmissions, find the best configuration
         # Get only the *active* filter transmissions:
@@ -445,16 +445,18 @@ class SystemGroupBase(PVGroup):
         config = tuple(self.active_config.value)
         offset = self.parent.first_filter
 
-        transm = np.zeros_like(config) * np.nan
-        transm3 = np.zeros_like(config) * np.nan
+        # Filters which are not inserted do not attenuate:
+        transm = np.ones(len(config))
+        transm3 = np.ones(len(config))
         for idx, filt in self.active_filters.items():
             zero_index = idx - offset
-            if State(config[zero_index]).is_inserted:
+            # Values beyond "Out" are the inserted states
+            if config[zero_index] > util.STATE_OUT:
                 transm[zero_index] = filt.transmission.value
                 transm3[zero_index] = filt.transmission_3omega.value
 
-        await self.transmission_actual.write(np.nanprod(transm))
-        await self.transmission_3omega_actual.write(np.nanprod(transm3))
+        await self.transmission_actual.write(np.prod(transm))
+        await self.transmission_3omega_actual.write(np.prod(transm3))
 
     async def move_blade_step(self, state: Dict[int, State]):
         """
@@ -624,7 +626,7 @@ class SystemGroupBase(PVGroup):
             await self.active_config.write(new_config)
             await self.active_config_bitmask.write(
                 util.int_array_to_bit_string(
-                    [State(blade).is_inserted for blade in new_config]
+                    [blade > util.STATE_OUT for blade in new_config]
                 )
             )
             await self._update_active_transmission()
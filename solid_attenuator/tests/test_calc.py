@@ -365,3 +365,70 @@ def test_ladder(request, blades, mode, soft_photon_energy):
     subplot[0].figure.savefig(
         f"{param_id}.png", transparent=True, bbox_inches="tight", pad_inches=0.2
     )
+
+
+@pytest.mark.parametrize("num_blades", [0, 1, 4, 9])
+def test_in_out_combinations(num_blades):
+    table = calculator.in_out_combinations(num_blades)
+    assert table.shape == (2 ** num_blades, num_blades)
+    assert table.dtype == np.uint8
+    for k, row in enumerate(table):
+        assert int("".join(str(bit) for bit in row[::-1]) or "0", 2) == k
+
+
+@pytest.mark.parametrize(
+    "all_transmissions, t_des, expected_low, expected_high, expected_states",
+    [
+        pytest.param([0.5, 0.25], 0.3, 0.25, 0.5, None, id="bracketed"),
+        pytest.param([0.5, 0.25], 0.5, 0.5, 0.5, None, id="exact"),
+        pytest.param([0.5, 0.25], 0.01, 0.125, 0.125, None, id="below_all"),
+        pytest.param([0.5, 0.25], 2.0, 1.0, 1.0, None, id="above_all"),
+        pytest.param([0.9, np.nan, 0.05], 0.3, 0.05, 0.9, None, id="stuck"),
+        pytest.param([0.0, 0.5, 0.25], 0.0, 0.0, 0.0, None, id="zero"),
+        pytest.param(
+            [0.9, 0.8, 0.7, 0.6, 0.5, 0.4, 0.3], 0.05, 0.048, 0.0504, None,
+            id="seven",
+        ),
+        pytest.param(
+            [0.5, 0.5, 0.25], 0.25, 0.25, 0.25, [0, 0, 1],
+            id="fewest_filters",
+        ),
+    ],
+)
+def test_find_configs(all_transmissions, t_des, expected_low, expected_high,
+                      expected_states):
+    low, high = calculator.find_configs(all_transmissions, t_des=t_des)
+    assert low.transmission == pytest.approx(expected_low)
+    assert high.transmission == pytest.approx(expected_high)
+    for conf in (low, high):
+        expected = np.nanprod(
+            np.where(conf.filter_states, all_transmissions, 1.0)
+        )
+        assert conf.transmission == pytest.approx(expected)
+        if expected_states is not None:
+            assert list(conf.filter_states) == expected_states
+
+
+@pytest.mark.parametrize(
+    "photon_energy, expected_idx",
+    [
+        (0.0, 0),
+        (1.4, 0),
+        (1.6, 1),
+        (3.4, 1),
+        (3.6, 2),
+        (8.0, 3),
+        (100.0, 3),
+    ],
+)
+def test_find_closest_energy_nonuniform(photon_energy, expected_idx):
+    table = calculator.AbsorptionTable(
+        eV=np.asarray([1.0, 2.0, 5.0, 10.0]),
+        f2=np.zeros(4),
+        mu=np.zeros(4),
+    )
+    closest_energy, closest_idx = calculator.find_closest_energy(
+        photon_energy, table
+    )
+    assert closest_idx == expected_idx
+    assert closest_energy == table.eV[expected_idx]
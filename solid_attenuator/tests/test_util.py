@@ -0,0 +1,130 @@
+import asyncio
+import random
+import threading
+import time
+
+import pytest
+
+from .. import util
+
+
+def run(coro, timeout=10.0):
+    """Run ``coro`` in a new event loop, failing if it takes too long."""
+    return asyncio.run(asyncio.wait_for(coro, timeout))
+
+
+@pytest.mark.parametrize("num_producers", [1, 4])
+def test_monitor_queue_producer_order(num_producers):
+    num_items = 2000
+
+    async def test():
+        queue = util._MonitorQueue(asyncio.get_running_loop())
+
+        def produce(producer):
+            # Randomly pause to exercise waking up the parked consumer
+            rng = random.Random(producer)
+            for item in range(num_items):
+                queue.put((producer, item))
+                if rng.random() < 0.05:
+                    time.sleep(1e-4)
+
+        threads = [
+            threading.Thread(target=produce, args=(producer, ), daemon=True)
+            for producer in range(num_producers)
+        ]
+        for thread in threads:
+            thread.start()
+
+        rng = random.Random(0)
+        received = {producer: [] for producer in range(num_producers)}
+        for _ in range(num_items * num_producers):
+            # Would time out on a lost wake-up:
+            batch = await asyncio.wait_for(
+                queue.async_get_batch(rng.randint(1, 8)), 2.0
+            )
+            for producer, item in batch:
+                received[producer].append(item)
+            if sum(len(items) for items in received.values()) == (
+                    num_items * num_producers):
+                break
+
+        for thread in threads:
+            thread.join()
+
+        assert received == {
+            producer: list(range(num_items))
+            for producer in range(num_producers)
+        }
+
+    run(test())
+
+
+def test_monitor_queue_wakes_from_empty():
+    async def test():
+        queue = util._MonitorQueue(asyncio.get_running_loop())
+        timer = threading.Timer(0.1, queue.put, args=("item", ))
+        timer.start()
+        assert await asyncio.wait_for(queue.async_get_batch(10), 2.0) == [
+            "item"
+        ]
+        timer.join()
+
+    run(test())
+
+
+def test_monitor_queue_reuse_after_cancel():
+    async def test():
+        queue = util._MonitorQueue(asyncio.get_running_loop())
+        task = asyncio.ensure_future(queue.async_get_batch(10))
+        await asyncio.sleep(0.05)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        thread = threading.Thread(target=queue.put, args=("item", ))
+        thread.start()
+        assert await asyncio.wait_for(queue.async_get_batch(10), 2.0) == [
+            "item"
+        ]
+        thread.join()
+
+    run(test())
+
+
+def test_monitor_queue_max_batch():
+    async def test():
+        queue = util._MonitorQueue(asyncio.get_running_loop())
+        for item in range(10):
+            queue.put(item)
+
+        batches = [await queue.async_get_batch(3) for _ in range(4)]
+        assert batches == [[0, 1, 2], [3, 4, 5], [6, 7, 8], [9]]
+
+    run(test())
+
+
+@pytest.mark.parametrize("max_batch", [0, -1])
+def test_monitor_queue_invalid_max_batch(max_batch):
+    async def test():
+        queue = util._MonitorQueue(asyncio.get_running_loop())
+        queue.put("item")
+        with pytest.raises(ValueError):
+            await queue.async_get_batch(max_batch)
+
+    run(test())
+
+
+@pytest.mark.parametrize(
+    "int_array, expected",
+    [
+        pytest.param([], 0, id="empty"),
+        pytest.param([1, 0, 0, 0], 8, id="binary"),
+        pytest.param([True, 0, 1.0], 5, id="mixed_types"),
+        pytest.param(["1", "1"], 3, id="strings"),
+        pytest.param([1, 2], 0, id="non_binary"),
+        pytest.param([1, float("nan")], 0, id="nan"),
+        pytest.param(["1", "a"], 0, id="non_numeric"),
+    ]
+)
+def test_int_array_to_bit_string(int_array, expected):
+    assert util.int_array_to_bit_string(int_array) == expected
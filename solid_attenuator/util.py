@@ -1,14 +1,13 @@
+import asyncio
 import enum
 import functools
+import queue as queue_mod
 import sys
 import typing
 
 import caproto
 import caproto._log as caproto_log
 import caproto.threading
-import numpy as np
-
-_default_thread_context = None
 
 
 class MisconfigurationError(Exception):
@@ -37,51 +36,123 @@ class State(enum.IntEnum):
     In_08 = 9
     In_09 = 10
 
+    # The following are precomputed per member below the class definition.
+
     @property
     def filter_index(self) -> typing.Optional[int]:
         """The one-based filter index, if inserted."""
-        if not self.is_inserted:
-            return None
-        return self.value - 1
+        return self._filter_index
 
     @property
     def is_inserted(self) -> bool:
         """Is a filter inserted?"""
-        return self not in {State.Moving, State.Out}
+        return self._is_inserted
 
     @property
     def is_moving(self) -> bool:
         """Is the blade moving?"""
-        return self == State.Moving
+        return self._is_moving
 
     @classmethod
-    def from_filter_index(self, idx: typing.Optional[int]) -> 'State':
+    def from_filter_index(cls, idx: typing.Optional[int]) -> 'State':
         """Get a State from a filter index (where filter 1 is 1)."""
-        return {
-            None: State.Out,
-            np.nan: State.Out,
-            0: State.Out,
-            1: State.In_01,
-            2: State.In_02,
-            3: State.In_03,
-            4: State.In_04,
-            5: State.In_05,
-            6: State.In_06,
-            7: State.In_07,
-            8: State.In_08,
-            9: State.In_09,
-        }[idx]
+        if idx is None or idx != idx:
+            # None or NaN
+            return cls.Out
+        filter_index = int(idx)
+        if filter_index != idx or not (
+                0 <= filter_index < len(_FILTER_INDEX_TO_STATE)):
+            raise ValueError(f'Invalid filter index: {idx}')
+        return _FILTER_INDEX_TO_STATE[filter_index]
 
     def __repr__(self):
         return self.name
 
 
+# Plain integer value of State.Out, for comparing against raw PV values
+# in hot paths without going through the enum.  Convert to State at the PV
+# boundary otherwise.
+STATE_OUT = int(State.Out)
+
+# States indexed by value - these are contiguous, starting at Moving (0):
+_STATES = tuple(State)
+
+for _state in _STATES:
+    _state._is_moving = _state is State.Moving
+    _state._is_inserted = not (_state._is_moving or _state is State.Out)
+    _state._filter_index = _state.value - 1 if _state._is_inserted else None
+
+del _state
+
+# Filter index (with 0 meaning no filter) to State:
+_FILTER_INDEX_TO_STATE = _STATES[State.Out:]
+
+
+@functools.lru_cache(maxsize=None)
 def get_default_thread_context():
     """Get a shared caproto threading client context."""
-    global _default_thread_context
-    if _default_thread_context is None:
-        _default_thread_context = caproto.threading.client.Context()
-    return _default_thread_context
+    return caproto.threading.client.Context()
+
+
+class _MonitorQueue:
+    """
+    Hand off monitor events from caproto client threads to an asyncio loop.
+
+    Events are put on a `queue.SimpleQueue` from any thread.  The event loop
+    is only woken up - by way of ``call_soon_threadsafe`` - when the consumer
+    is parked waiting on an empty queue, rather than once per event.
+
+    Parameters
+    ----------
+    loop : asyncio.AbstractEventLoop
+        The event loop of the consumer.
+    """
+
+    def __init__(self, loop: asyncio.AbstractEventLoop):
+        self._loop = loop
+        self._events = queue_mod.SimpleQueue()
+        self._waiter = None
+
+    def put(self, item):
+        """Add an item to the queue - safe to call from any thread."""
+        self._events.put(item)
+        # The consumer publishes its waiter before checking for events one
+        # last time, so either it sees this item or this sees its waiter.
+        waiter = self._waiter
+        if waiter is not None and not waiter.done():
+            self._loop.call_soon_threadsafe(_set_waiter_result, waiter)
+
+    async def async_get_batch(self, max_items: int) -> list:
+        """
+        Get up to ``max_items`` items from the queue, waiting if it is empty.
+        """
+        if max_items < 1:
+            raise ValueError(f'max_items must be at least 1: {max_items}')
+
+        events = self._events
+        while True:
+            items = []
+            try:
+                while len(items) < max_items:
+                    items.append(events.get_nowait())
+            except queue_mod.Empty:
+                ...
+
+            if items:
+                return items
+
+            self._waiter = self._loop.create_future()
+            try:
+                if events.empty():
+                    await self._waiter
+            finally:
+                self._waiter = None
+
+
+def _set_waiter_result(waiter: asyncio.Future):
+    """Wake up a `_MonitorQueue` consumer, unless it has been cancelled."""
+    if not waiter.done():
+        waiter.set_result(None)
 
 
 def _monitor_pvs(*pv_names, context, queue, data_type='time'):
@@ -94,8 +165,8 @@ def _monitor_pvs(*pv_names, context, queue, data_type='time'):
         PV names to monitor.
     context : caproto.threading.client.Context
         The threading context to use.
-    queue : ThreadsafeQueue
-        Thread-safe queue for the current server async library.
+    queue : _MonitorQueue or ThreadsafeQueue
+        Thread-safe queue, supporting ``put``, to receive events.
     data_type : {'time', 'control', 'native'}
         The subscription type.
 
@@ -105,12 +176,16 @@ def _monitor_pvs(*pv_names, context, queue, data_type='time'):
         List of subscription tuples, with each being:
         ``(sub, subscription_token, *callback_references)``
     """
+    # NOTE: caproto only holds weak references to these callbacks, which are
+    # kept alive by way of the returned subscription list.  A single queue
+    # keeps connection and subscription events in order.
+    put = queue.put
 
     def add_to_queue(sub, event_add_response):
-        queue.put(('subscription', sub, event_add_response))
+        put(('subscription', sub, event_add_response))
 
     def connection_state_callback(pv, state):
-        queue.put(('connection', pv, state))
+        put(('connection', pv, state))
 
     pvs = context.get_pvs(
         *pv_names, timeout=None,
@@ -127,19 +202,28 @@ def _monitor_pvs(*pv_names, context, queue, data_type='time'):
     return subscriptions
 
 
-async def monitor_pvs(*pv_names, async_lib, context=None, data_type='time'):
+async def monitor_pvs(*pv_names, async_lib, context=None, data_type='time',
+                      max_batch=64):
     """
     Monitor pv_names asynchronously, yielding events as they happen.
+
+    Events are handed off from the caproto client threads to the running
+    asyncio event loop.
+
     Parameters
     ----------
     *pv_names : str
         PV names to monitor.
     async_lib : caproto.server.AsyncLibraryLayer
-        The async library layer shim to get compatible classes from.
+        The async library layer shim.  Only asyncio is supported.
     context : caproto.threading.client.Context
         The threading context to use.
     data_type : {'time', 'control', 'native'}
         The subscription type.
+    max_batch : int, optional
+        The maximum number of events to take from the queue at once, at least
+        1.  Events are then yielded without waiting on the queue in between.
+
     Yields
     -------
     event : {'subscription', 'connection'}
@@ -156,16 +240,31 @@ async def monitor_pvs(*pv_names, async_lib, context=None, data_type='time'):
     if context is None:
         context = get_default_thread_context()
 
-    queue = async_lib.ThreadsafeQueue()
+    loop = asyncio.get_running_loop()
+    queue = _MonitorQueue(loop)
     subscriptions = _monitor_pvs(*pv_names, context=context, queue=queue,
                                  data_type=data_type)
     try:
         while True:
-            event, context, data = await queue.async_get()
-            yield event, context, data
+            for event, context, data in await queue.async_get_batch(max_batch):
+                yield event, context, data
     finally:
-        for sub, token, *callbacks in subscriptions:
-            sub.remove_callback(token)
+        # Removing the last callback of a subscription takes caproto client
+        # locks and sends an unsubscribe request; keep that off of the loop.
+        try:
+            removal = loop.run_in_executor(None, _remove_subscriptions,
+                                           subscriptions)
+        except RuntimeError:
+            # The executor may already be shut down when exiting
+            _remove_subscriptions(subscriptions)
+        else:
+            await removal
+
+
+def _remove_subscriptions(subscriptions):
+    """Remove the subscription callbacks added by `_monitor_pvs`."""
+    for sub, token, *callbacks in subscriptions:
+        sub.remove_callback(token)
 
 
 def config_logging(logger, file=sys.stdout, datefmt='%H:%M:%S', color=True,
@@ -227,7 +326,8 @@ def hack_max_length_of_channeldata(channeldata: caproto.ChannelData,
         The ChannelData instance.
 
     new_value : list
-        The new value to set.
+        The new value to set.  A list is used as-is, without copying, and
+        must not be modified by the caller afterward.
 
     max_length : int, optional
         The new maximum length to use. Defaults to `len(new_value)`, and
@@ -236,7 +336,9 @@ def hack_max_length_of_channeldata(channeldata: caproto.ChannelData,
     max_length = max_length or len(new_value)
     assert max_length >= len(new_value)
     channeldata._max_length = max_length
-    channeldata._data['value'] = list(new_value)
+    if not isinstance(new_value, list):
+        new_value = list(new_value)
+    channeldata._data['value'] = new_value
 
 
 def process_writes_value(pvprop: caproto.server.pvproperty, *,
@@ -254,11 +356,13 @@ def process_writes_value(pvprop: caproto.server.pvproperty, *,
         the current value of `pvprop`.
     """
 
-    async def wrapped(fields, instance, proc_value, *, value_to_write=value):
-        pvprop_instance = fields.parent
-        if value_to_write is None:
-            value_to_write = pvprop_instance.value
-        await pvprop_instance.write(value_to_write)
+    if value is None:
+        async def wrapped(fields, instance, proc_value):
+            pvprop_instance = fields.parent
+            await pvprop_instance.write(pvprop_instance.value)
+    else:
+        async def wrapped(fields, instance, proc_value):
+            await fields.parent.write(value)
 
     pvprop.fields.process_record.putter(wrapped)
 
@@ -279,15 +383,20 @@ def block_on_reentry(token=None):
     """
 
     def inner(func):
+        key = token or func.__name__
+
         @functools.wraps(func)
         async def wrapped(self, *args, **kwargs):
-            key = token or func.__name__
-            if key not in self._context:
-                self._context[key] = self.async_lib.library.Lock()
+            try:
+                lock = self._context[key]
+            except KeyError:
+                lock = self._context[key] = self.async_lib.library.Lock()
 
-            lock = self._context[key]
-            async with lock:
+            await lock.acquire()
+            try:
                 return await func(self, *args, **kwargs)
+            finally:
+                lock.release()
 
         return wrapped
 
@@ -309,17 +418,28 @@ def int_array_to_bit_string(int_array: list) -> int:
     -------
     value : int
     """
-    try:
-        return int(''.join(str(int(c)) for c in int_array), 2)
-    except ValueError:
-        return 0
+    value = 0
+    for bit in int_array:
+        try:
+            bit = int(bit)
+        except ValueError:
+            return 0
+        if bit not in (0, 1):
+            return 0
+        value = (value << 1) | bit
+    return value
+
+
+_NO_ALARM = (caproto.AlarmStatus.NO_ALARM, caproto.AlarmSeverity.NO_ALARM)
 
 
 async def alarm_if(
         data: caproto.ChannelData,
         condition: bool,
-        status: caproto.AlarmStatus,
-        severity: caproto.AlarmSeverity = caproto.AlarmSeverity.MAJOR_ALARM
+        status: typing.Union[caproto.AlarmStatus, int],
+        severity: typing.Union[caproto.AlarmSeverity, int] = (
+            caproto.AlarmSeverity.MAJOR_ALARM
+        ),
         ):
     """
     Set an alarm if the condition is met - otherwise NO_ALARM.
@@ -332,19 +452,24 @@ async def alarm_if(
     condition : bool
         Condition to choose alarm status and severity.
 
-    status : caproto.AlarmStatus
+    status : caproto.AlarmStatus or int
         Status to set if condition is met.
 
-    severity : caproto.AlarmSeverity
+    severity : caproto.AlarmSeverity or int
         Severity to set if condition is met.  Defaults to MAJOR_STATUS.
     """
     if condition:
-        # Raise the alarm - use passed-in alarm settings.
-        status = caproto.AlarmStatus(status)
-        severity = caproto.AlarmSeverity(severity)
+        # Raise the alarm - use passed-in alarm settings.  Members are used
+        # as-is; plain integers are converted to keep the enum types.
+        if type(status) is int:
+            status = caproto.AlarmStatus(status)
+        if type(severity) is int:
+            severity = caproto.AlarmSeverity(severity)
     else:
-        status = caproto.AlarmStatus.NO_ALARM
-        severity = caproto.AlarmSeverity.NO_ALARM
+        status, severity = _NO_ALARM
+
+    alarm = data.alarm
+    if alarm.status == status and alarm.severity == severity:
+        return
 
-    if data.alarm.status != status or data.alarm.severity != severity:
-        await data.alarm.write(status=status, severity=severity)
+    await alarm.write(status=status, severity=severity)